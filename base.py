@@ -3,10 +3,16 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Type, TypeVar
 
+import numpy as np
 from pydantic import BaseModel, Field
 
+_BAR_FORMAT_ERROR = "Each bar must be a list like [timestamp, open, high, low, close, volume, is_close]"
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
 
 class IndicatorResultBase(BaseModel):
     """Base result object; every indicator result must include timestamp."""
@@ -15,6 +21,7 @@ class IndicatorResultBase(BaseModel):
     buy: Optional[bool] = Field(default=None, description="buy signal")
     sell: Optional[bool] = Field(default=None, description="sell signal")
 
+
 class IndicatorBase(ABC):
     """Base context-managed indicator."""
 
@@ -42,3 +49,74 @@ class IndicatorBase(ABC):
     def on_bar(self, bars: List[list]) -> List[IndicatorResultBase]:
         """Process price data where each bar = [timestamp, open, high, low, close, volume, is_close] and return a list with the same length, using None for missing values to keep alignment."""
         raise NotImplementedError
+
+    def on_bar_arrays(
+        self,
+        timestamps: Sequence[int],
+        opens: Sequence[float],
+        highs: Sequence[float],
+        lows: Sequence[float],
+        closes: Sequence[float],
+        volumes: Sequence[float],
+    ) -> List[IndicatorResultBase]:
+        """Column-wise variant of `on_bar` (one sequence per bar field, every bar treated as closed).
+
+        The default builds bar rows and delegates to `on_bar`; indicators override it to consume
+        the columns directly.
+        """
+        self._column_length((timestamps, opens, highs, lows, closes, volumes))
+        bars = [list(row) + [True] for row in zip(timestamps, opens, highs, lows, closes, volumes)]
+        return self.on_bar(bars)
+
+    @staticmethod
+    def _cached_model(cls: Type[ModelT], params: Dict[str, Any]) -> ModelT:
+        """Validate each distinct params dict once per model and hand out unvalidated copies afterwards."""
+        try:
+            items = tuple(
+                sorted(
+                    (key, tuple(value) if isinstance(value, list) else value) for key, value in params.items()
+                )
+            )
+            hash(items)
+        except TypeError:
+            return cls(**params)  # unhashable input: let pydantic validate (and report) as usual
+        return IndicatorBase._validated_model(cls, items).copy()
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _validated_model(cls: Type[ModelT], items: Tuple[Tuple[str, Any], ...]) -> ModelT:
+        return cls(**dict(items))
+
+    @staticmethod
+    def _column_length(columns: Sequence[Sequence[float]]) -> int:
+        length = len(columns[0])
+        if any(len(column) != length for column in columns):
+            raise ValueError("All bar columns must have the same length")
+        return length
+
+    @staticmethod
+    def _array_column(column: Sequence[float], dtype: type = float) -> np.ndarray:
+        """Cast one bar column, rejecting None cells that `np.asarray` would turn into NaN."""
+        if not (isinstance(column, np.ndarray) and column.dtype != object) and None in column:
+            raise ValueError("Bar columns must not contain None")
+        return np.asarray(column, dtype=dtype)
+
+    @staticmethod
+    def _bars_array(bars: List[list]) -> np.ndarray:
+        """One shape check and an object array for per-column casts, instead of per-row loops."""
+        try:
+            data = np.asarray(bars, dtype=object)
+        except ValueError:
+            data = None
+        if data is None or data.ndim != 2:
+            # Ragged rows: fields past is_close are ignored, as the per-row parsers did.
+            try:
+                data = np.asarray([row[:7] for row in bars], dtype=object)
+            except (TypeError, ValueError) as exc:
+                raise ValueError(_BAR_FORMAT_ERROR) from exc
+        if data.ndim != 2 or data.shape[1] < 7:
+            raise ValueError(_BAR_FORMAT_ERROR)
+        # `astype(float)` would quietly turn None into NaN where a float() cast raised.
+        if np.equal(data[:, :6], None).any():
+            raise ValueError(_BAR_FORMAT_ERROR)
+        return data
@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 import math
-from typing import Any, Dict, List, Tuple, Union
+from functools import partial
+from itertools import repeat
+from typing import Any, Callable, Dict, List, Literal, NamedTuple, Optional, Sequence, Tuple, Union
 
 import numpy as np
 import talib
@@ -50,6 +52,10 @@ class TAConfig(BaseModel):
 
     name: str = Field(..., description="指标名称：ATR/CCI/MACD/RSI/MA/EMA")
     params: Tuple[float, ...] = Field(default_factory=tuple, description="指标参数")
+    return_type: Literal["model", "dict"] = Field(
+        "model",
+        description="结果类型：model 返回结果模型，dict 返回可直接序列化的字典",
+    )
 
     @validator("name")
     def _name_upper(cls, value: str) -> str:
@@ -59,6 +65,15 @@ class TAConfig(BaseModel):
             raise ValueError(f"Unsupported indicator {value}, must be one of {sorted(supported)}")
         return upper
 
+
+class _StreamState(NamedTuple):
+    """Recurrence state kept by `ta_indicator.on_new_bars` between calls."""
+
+    committed: Tuple[float, ...]  # after the bar before the latest one
+    pending: Tuple[float, ...]  # after the latest bar, which may still be forming
+    timestamp: int  # timestamp of the latest bar
+
+
 class ta_indicator(IndicatorBase):
     """Compute a single indicator (ATR, CCI, MACD, RSI, MA, or EMA) for bar data."""
 
@@ -73,6 +88,29 @@ class ta_indicator(IndicatorBase):
         "EMA": (20,),
     }
 
+    # Indicator name -> (TA-Lib function, keyword names matching the params tuple).
+    _TALIB_FUNCTIONS: Dict[str, Tuple[str, Tuple[str, ...]]] = {
+        "ATR": ("ATR", ("timeperiod",)),
+        "CCI": ("CCI", ("timeperiod",)),
+        "MACD": ("MACD", ("fastperiod", "slowperiod", "signalperiod")),
+        "RSI": ("RSI", ("timeperiod",)),
+        "MA": ("SMA", ("timeperiod",)),
+        "EMA": ("EMA", ("timeperiod",)),
+    }
+
+    # Indicator name -> (result model, result fields in TA-Lib output order).
+    _RESULT_TYPES: Dict[str, Tuple[type, Tuple[str, ...]]] = {
+        "ATR": (ATRResult, ("atr",)),
+        "CCI": (CCIResult, ("cci",)),
+        "MACD": (MACDResult, ("macd", "signal", "hist")),
+        "RSI": (RSIResult, ("rsi",)),
+        "MA": (MAResult, ("ma",)),
+        "EMA": (EMAResult, ("ema",)),
+    }
+
+    # Indicators whose TA-Lib recurrence `on_new_bars` advances one bar at a time.
+    _STREAMING = frozenset({"ATR", "MACD", "RSI", "EMA"})
+
     def __init__(self, params: Union[TAConfig, Dict[str, Any]]):
         """
         Accepts either a TAConfig instance or a plain dict containing the same fields.
@@ -82,7 +120,18 @@ class ta_indicator(IndicatorBase):
                 "params": (12, 26, 9)
             }
         """
-        self.params = params if isinstance(params, TAConfig) else TAConfig(**params)
+        self.params = params if isinstance(params, TAConfig) else self._cached_model(TAConfig, params)
+
+        name = self.params.name
+        args = self.params.params or self._DEFAULT_PARAMS[name]
+        function_name, keywords = self._TALIB_FUNCTIONS[name]
+        if len(args) != len(keywords):
+            raise ValueError(f"{name} expects {len(keywords)} params {keywords}, got {tuple(args)}")
+        # Resolve the TA-Lib function once instead of looking it up on every call.
+        self._function = getattr(talib, function_name)
+        self._function_kwargs = {key: int(value) for key, value in zip(keywords, args)}
+        self._stream: Optional[_StreamState] = None
+        self._warmup: Optional[np.ndarray] = None  # bars seen before the recurrence could be seeded
 
     def describe_purpose(self) -> str:
         return (
@@ -95,102 +144,231 @@ class ta_indicator(IndicatorBase):
             "Accepts TAConfig or dict with fields: name (ATR/CCI/MACD/RSI/MA/EMA) and params Tuple[float, ...]. "
             "params supplies the periods: ATR(timeperiod), CCI(timeperiod), "
             "MACD(fast, slow, signal), RSI(timeperiod), MA(timeperiod), EMA(timeperiod). "
-            "If params is empty the class defaults to (14), (20), or (12,26,9) accordingly."
+            "If params is empty the class defaults to (14), (20), or (12,26,9) accordingly. "
+            "return_type='dict' returns plain dicts instead of result models."
         )
 
     def describe_output(self) -> str:
         return (
-            "Returns List[IndicatorResultBase] aligned with input bars. "
+            "Returns List[IndicatorResultBase] (or dicts, see return_type) aligned with input bars. "
             "Each entry contains the original timestamp plus indicator-specific fields "
-            "(atr/cci/rsi/ma/ema or macd/signal/hist). Warm-up elements may be NaN."
+            "(atr/cci/rsi/ma/ema or macd/signal/hist). Warm-up elements may be NaN. "
+            "on_new_bars (ATR/MACD/RSI/EMA) returns entries for the new bars only, matching a full "
+            "recomputation up to floating-point rounding. With return_type='dict' each entry is a plain dict with the "
+            "same keys as the result model (timestamp, buy, sell and the indicator fields), "
+            "ready for json/orjson serialization without pydantic overhead."
         )
 
-    def on_bar(self, bars: List[list]) -> List[IndicatorResultBase]:
+    def on_bar(self, bars: List[list]) -> List[Union[IndicatorResultBase, Dict[str, Any]]]:
         if not bars:
             return []
 
-        parsed_rows: List[list] = []
-        for row in bars:
-            if not isinstance(row, (list, tuple)) or len(row) < 7:
-                raise ValueError(
-                    "Each bar must be a list like [timestamp, open, high, low, close, volume, is_close]"
-                )
-            parsed_rows.append(row)
-
-        timestamps = [int(row[0]) for row in parsed_rows]
-        opens = np.array([float(row[1]) for row in parsed_rows], dtype=float)
-        highs = np.array([float(row[2]) for row in parsed_rows], dtype=float)
-        lows = np.array([float(row[3]) for row in parsed_rows], dtype=float)
-        closes = np.array([float(row[4]) for row in parsed_rows], dtype=float)
-        volumes = np.array([float(row[5]) for row in parsed_rows], dtype=float)
-        is_close = [bool(row[6]) for row in parsed_rows]
-
-        _ = opens, volumes, is_close  # placeholders for future logic
-
-        name = self.params.name  # already upper-cased by validator
-        args = self.params.params or self._DEFAULT_PARAMS[name]
+        data = self._bars_array(bars)
+        timestamps = data[:, 0].astype(np.int64).tolist()
+        return self._build_results(timestamps, self._compute(partial(self._column, data)))
 
-        if name == "ATR":
-            (period,) = args
-            values = talib.ATR(highs, lows, closes, timeperiod=int(period))
-            return self._build_results(timestamps, values, ATRResult, field="atr")
-
-        if name == "CCI":
-            (period,) = args
-            values = talib.CCI(highs, lows, closes, timeperiod=int(period))
-            return self._build_results(timestamps, values, CCIResult, field="cci")
-
-        if name == "MACD":
-            fast, slow, signal = args
-            macd, signal_arr, hist = talib.MACD(
-                closes,
-                fastperiod=int(fast),
-                slowperiod=int(slow),
-                signalperiod=int(signal),
-            )
-            return [
-                MACDResult(
-                    timestamp=ts,
-                    macd=self._clean_value(macd[idx]),
-                    signal=self._clean_value(signal_arr[idx]),
-                    hist=self._clean_value(hist[idx]),
-                )
-                for idx, ts in enumerate(timestamps)
-            ]
+    def on_new_bars(self, bars: List[list]) -> List[Union[IndicatorResultBase, Dict[str, Any]]]:
+        """
+        Streaming variant of `on_bar` for ATR/MACD/RSI/EMA: pass only the bars received since the
+        previous call and get results for exactly those bars. A first bar carrying the previous
+        call's last timestamp replaces that (still forming) bar. Once TA-Lib has seeded the
+        recurrence from the warm-up bars, each call costs O(len(bars)).
+        """
+        name = self.params.name
+        if name not in self._STREAMING:
+            raise ValueError(f"on_new_bars supports {sorted(self._STREAMING)}, not {name}")
+        if not bars:
+            return []
 
-        if name == "RSI":
-            (period,) = args
-            values = talib.RSI(closes, timeperiod=int(period))
-            return self._build_results(timestamps, values, RSIResult, field="rsi")
+        data = self._bars_array(bars)[:, :7]
+        timestamps = data[:, 0].astype(np.int64).tolist()
+        if self._stream is not None:
+            previous: Optional[int] = self._stream.timestamp
+        elif self._warmup is not None:
+            previous = int(self._warmup[-1, 0])
+        else:
+            previous = None
+        if (previous is not None and timestamps[0] < previous) or any(
+            later <= earlier for earlier, later in zip(timestamps, timestamps[1:])
+        ):
+            raise ValueError("on_new_bars expects increasing timestamps that continue the previous call")
+        replaces = timestamps[0] == previous
+
+        if self._stream is None:
+            # Warm-up: run TA-Lib over everything seen so far until the recurrence can be seeded.
+            history = data
+            if self._warmup is not None:
+                history = np.concatenate((self._warmup[:-1] if replaces else self._warmup, data))
+            columns = self._compute(partial(self._column, history))
+            self._stream = self._seed_stream(history, columns)
+            self._warmup = None if self._stream is not None else history
+            return self._build_results(timestamps, [column[-len(timestamps) :] for column in columns])
+
+        state = self._stream.committed if replaces else self._stream.pending
+        committed = state
+        new_values = []
+        highs = self._column(data, 2).tolist()
+        lows = self._column(data, 3).tolist()
+        closes = self._column(data, 4).tolist()
+        for high, low, close in zip(highs, lows, closes):
+            committed = state
+            state, values = self._advance(state, high, low, close)
+            new_values.append(values)
+        self._stream = _StreamState(committed, state, timestamps[-1])
+        return self._build_results(timestamps, list(zip(*new_values)))
+
+    def on_bar_arrays(
+        self,
+        timestamps: Sequence[int],
+        opens: Sequence[float],
+        highs: Sequence[float],
+        lows: Sequence[float],
+        closes: Sequence[float],
+        volumes: Sequence[float],
+    ) -> List[Union[IndicatorResultBase, Dict[str, Any]]]:
+        """
+        Column-wise variant of `on_bar`: only the columns the indicator reads are cast,
+        without building per-bar rows. Always a full computation (`on_new_bars` state is untouched).
+        """
+        columns = (timestamps, opens, highs, lows, closes, volumes)
+        if self._column_length(columns) == 0:
+            return []
+        ts = self._array_column(timestamps, np.int64).tolist()
+        return self._build_results(ts, self._compute(lambda idx: self._array_column(columns[idx])))
 
-        if name == "MA":
-            (period,) = args
-            values = talib.SMA(closes, timeperiod=int(period))
-            return self._build_results(timestamps, values, MAResult, field="ma")
+    @staticmethod
+    def _column(data: np.ndarray, idx: int) -> np.ndarray:
+        return data[:, idx].astype(float)
+
+    def _compute(self, column: Callable[[int], np.ndarray]) -> Tuple[List[float], ...]:
+        """Run the indicator; `column(idx)` returns the float column at bar-field index `idx`.
+
+        Returns one list of values per result field, in `_RESULT_TYPES` order.
+        """
+        # Only ATR/CCI read highs and lows; the other indicators cast the close column alone.
+        if self.params.name in ("ATR", "CCI"):
+            inputs = (column(2), column(3), column(4))
+        else:
+            inputs = (column(4),)
+
+        outputs = self._function(*inputs, **self._function_kwargs)
+        if not isinstance(outputs, tuple):  # single-output indicators
+            outputs = (outputs,)
+        # `tolist` converts to Python floats (NaN warm-ups included) in one pass.
+        return tuple(values.tolist() for values in outputs)
+
+    def _seed_stream(self, data: np.ndarray, columns: Sequence[List[float]]) -> Optional[_StreamState]:
+        """
+        Capture the recurrence state after the second-to-last bar and after the last one.
+        The last bar may still be forming, so a replacement resumes from the bar before it.
+        """
+        if len(data) < 2:
+            return None
+
+        last = len(data) - 2
+        name = self.params.name
+        kwargs = self._function_kwargs
+        _, fields = self._RESULT_TYPES[name]
+        last_values = {field: column[last] for field, column in zip(fields, columns)}
+        closes = self._column(data, 4)
+        close = float(closes[last])
+        if name == "EMA":
+            state: Tuple[float, ...] = (last_values["ema"],)
+        elif name == "ATR":
+            state = (last_values["atr"], close)
+        elif name == "RSI":
+            if math.isnan(last_values["rsi"]):
+                return None
+            state = self._rsi_averages(closes[: last + 1].tolist(), kwargs["timeperiod"]) + (close,)
+        else:
+            if math.isnan(last_values["signal"]):
+                return None
+            # MACD seeds its fast EMA where the slow EMA starts, so align the fast series to match.
+            fast, slow = sorted((kwargs["fastperiod"], kwargs["slowperiod"]))
+            fast_ema = talib.EMA(closes[slow - fast :], timeperiod=fast)
+            slow_ema = talib.EMA(closes, timeperiod=slow)
+            state = (float(fast_ema[last - (slow - fast)]), float(slow_ema[last]), last_values["signal"])
+
+        if not all(math.isfinite(value) for value in state):
+            return None
+        pending, _ = self._advance(state, float(data[-1, 2]), float(data[-1, 3]), float(closes[-1]))
+        return _StreamState(state, pending, int(data[-1, 0]))
+
+    def _advance(
+        self, state: Tuple[float, ...], high: float, low: float, close: float
+    ) -> Tuple[Tuple[float, ...], Tuple[float, ...]]:
+        """Apply one bar to the TA-Lib recurrence; returns (new state, output values)."""
+        name = self.params.name
+        kwargs = self._function_kwargs
 
         if name == "EMA":
-            (period,) = args
-            values = talib.EMA(closes, timeperiod=int(period))
-            return self._build_results(timestamps, values, EMAResult, field="ema")
+            (ema,) = state
+            k = 2.0 / (kwargs["timeperiod"] + 1)
+            ema = (close - ema) * k + ema
+            return (ema,), (ema,)
 
-        raise ValueError(f"Unsupported indicator: {name}")
+        if name == "ATR":
+            atr, prev_close = state
+            period = kwargs["timeperiod"]
+            true_range = max(high - low, abs(prev_close - high), abs(low - prev_close))
+            atr = (atr * (period - 1) + true_range) / period
+            return (atr, close), (atr,)
+
+        if name == "RSI":
+            gain, loss, prev_close = state
+            period = kwargs["timeperiod"]
+            gain, loss = self._wilder_step(gain, loss, close - prev_close, period)
+            total = gain + loss
+            rsi = 100.0 * (gain / total) if abs(total) >= 1e-8 else 0.0
+            return (gain, loss, close), (rsi,)
+
+        fast_ema, slow_ema, signal = state
+        fast, slow = sorted((kwargs["fastperiod"], kwargs["slowperiod"]))
+        fast_k = 2.0 / (fast + 1)
+        slow_k = 2.0 / (slow + 1)
+        signal_k = 2.0 / (kwargs["signalperiod"] + 1)
+        fast_ema = (close - fast_ema) * fast_k + fast_ema
+        slow_ema = (close - slow_ema) * slow_k + slow_ema
+        macd = fast_ema - slow_ema
+        signal = (macd - signal) * signal_k + signal
+        return (fast_ema, slow_ema, signal), (macd, signal, macd - signal)
 
     @staticmethod
-    def _clean_value(value: float) -> float:
-        return value if not math.isnan(value) else math.nan
+    def _wilder_step(gain: float, loss: float, change: float, period: int) -> Tuple[float, float]:
+        gain *= period - 1
+        loss *= period - 1
+        if change < 0:
+            loss -= change
+        else:
+            gain += change
+        return gain / period, loss / period
+
+    @staticmethod
+    def _rsi_averages(closes: List[float], period: int) -> Tuple[float, float]:
+        """Wilder-smoothed average gain/loss through the last close, as TA-Lib's RSI computes them."""
+        gain = 0.0
+        loss = 0.0
+        for prev, close in zip(closes[:period], closes[1 : period + 1]):
+            change = close - prev
+            if change < 0:
+                loss -= change
+            else:
+                gain += change
+        gain /= period
+        loss /= period
+        for prev, close in zip(closes[period:], closes[period + 1 :]):
+            gain, loss = ta_indicator._wilder_step(gain, loss, close - prev, period)
+        return gain, loss
 
     def _build_results(
-        self,
-        timestamps: List[int],
-        values: np.ndarray,
-        model: type,
-        field: str,
-    ) -> List[IndicatorResultBase]:
-        results: List[IndicatorResultBase] = []
-        for idx, ts in enumerate(timestamps):
-            payload = {
-                "timestamp": ts,
-                field: self._clean_value(values[idx]),
-            }
-            results.append(model(**payload))
-        return results
+        self, timestamps: List[int], columns: Sequence[List[float]]
+    ) -> List[Union[IndicatorResultBase, Dict[str, Any]]]:
+        """Build the result rows (models or plain dicts) for every code path."""
+        model, fields = self._RESULT_TYPES[self.params.name]
+        if self.params.return_type == "dict":
+            keys = ("timestamp", "buy", "sell", *fields)
+            nones = repeat(None)
+            return [dict(zip(keys, row)) for row in zip(timestamps, nones, nones, *columns)]
+        # `construct` skips validation; values come straight from TA-Lib as Python floats.
+        keys = ("timestamp", *fields)
+        return [model.construct(**dict(zip(keys, row))) for row in zip(timestamps, *columns)]
@@ -2,16 +2,33 @@
 
 from __future__ import annotations
 
-from collections import defaultdict
-from typing import Any, Dict, List, Tuple, Union
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 
 import math
+from decimal import Decimal
 
+import numpy as np
 from pydantic import BaseModel, Field, validator
 
 from base import IndicatorBase, IndicatorResultBase
 
 
+def _value_area_bounds(
+    prices: np.ndarray, volumes: np.ndarray, target_volume: float
+) -> Tuple[float, float]:
+    """Return (vah, val) of the highest-volume levels whose cumulative volume reaches the target."""
+    ranked_volumes = np.sort(volumes)[::-1]
+    cumulative = np.cumsum(ranked_volumes)
+    # Take levels until the running volume first reaches the target (POC always included).
+    count = min(int(np.searchsorted(cumulative, target_volume)) + 1, volumes.size)
+    # Levels tied at the cut-off volume are taken lowest price first.
+    cut_volume = ranked_volumes[count - 1]
+    ahead = volumes > cut_volume
+    tied_prices = np.sort(prices[volumes == cut_volume])[: count - int(ahead.sum())]
+    included_prices = np.concatenate((prices[ahead], tied_prices))
+    return float(included_prices.max()), float(included_prices.min())
+
+
 class POCResult(IndicatorResultBase):
     poc: float | None = Field(default=None, description="Point of Control price level")
     vah: float | None = Field(default=None, description="Value Area High (covering 70% volume)")
@@ -20,6 +37,11 @@ class POCResult(IndicatorResultBase):
 
 class POCParams(BaseModel):
     value_area_pct: float = Field(0.7, ge=0.0, le=1.0, description="Value-area coverage ratio")
+    tick_size: Optional[float] = Field(
+        default=None,
+        gt=0.0,
+        description="Price increment used to bucket closes into profile levels; None keeps exact prices",
+    )
 
     @validator("value_area_pct")
     def _non_zero(cls, v: float) -> float:
@@ -27,6 +49,12 @@ class POCParams(BaseModel):
             raise ValueError("value_area_pct must be greater than 0")
         return v
 
+    @validator("tick_size")
+    def _finite_tick(cls, v: Optional[float]) -> Optional[float]:
+        if v is not None and not math.isfinite(v):
+            raise ValueError("tick_size must be a finite number")
+        return v
+
 
 class ta_indicator_poc(IndicatorBase):
     """Compute POC/VAH/VAL metrics cumulatively from the first bar onward."""
@@ -39,9 +67,9 @@ class ta_indicator_poc(IndicatorBase):
         Defaults to 70% coverage when params omitted.
         """
         if params is None:
-            self.params = POCParams()
+            self.params = self._cached_model(POCParams, {})
         else:
-            self.params = params if isinstance(params, POCParams) else POCParams(**params)
+            self.params = params if isinstance(params, POCParams) else self._cached_model(POCParams, params)
 
     def describe_purpose(self) -> str:
         return (
@@ -53,7 +81,10 @@ class ta_indicator_poc(IndicatorBase):
     def describe_params(self) -> str:
         return (
             "POCParams or dict with `value_area_pct` (float 0-1, default 0.7) "
-            "specifying how much of the cumulative volume must be included in the value area."
+            "specifying how much of the cumulative volume must be included in the value area, "
+            "and optional `tick_size` (float > 0) that buckets closes to the nearest tick; "
+            "each bucket is reported at its tick price (nearest tick count × tick_size, rounded to "
+            "the tick's decimal places), so e.g. tick_size=10 reports closes 104 and 96 as 100."
         )
 
     def describe_output(self) -> str:
@@ -66,62 +97,107 @@ class ta_indicator_poc(IndicatorBase):
         if not bars:
             return []
 
-        parsed_rows = self._parse_bars(bars)
-        profile = defaultdict(float)
-        results: List[POCResult] = []
-
-        for timestamp, close_price, volume in parsed_rows:
-            profile[close_price] += volume
-            poc, vah, val = self._compute_profile(profile)
-            results.append(
-                POCResult(
-                    timestamp=timestamp,
-                    poc=poc,
-                    vah=vah,
-                    val=val,
-                )
+        return self._compute(*self._parse_bars(bars))
+
+    def on_bar_arrays(
+        self,
+        timestamps: Sequence[int],
+        opens: Sequence[float],
+        highs: Sequence[float],
+        lows: Sequence[float],
+        closes: Sequence[float],
+        volumes: Sequence[float],
+    ) -> List[IndicatorResultBase]:
+        """Column-wise variant of `on_bar`; reads the timestamp, close and volume columns directly."""
+        if self._column_length((timestamps, opens, highs, lows, closes, volumes)) == 0:
+            return []
+        return self._compute(
+            self._array_column(timestamps, np.int64),
+            self._array_column(closes),
+            self._array_column(volumes),
+        )
+
+    def _compute(
+        self, timestamps: np.ndarray, closes: np.ndarray, volumes: np.ndarray
+    ) -> List[IndicatorResultBase]:
+        levels, level_ids = self._price_levels(closes, self.params.tick_size)
+        level_prices = levels.tolist()
+        level_volumes = np.zeros(levels.size, dtype=float)
+        level_count = 0
+        total_volume = 0.0
+        poc_price = math.nan
+        poc_volume = -math.inf
+        results: List[POCResult] = [None] * len(timestamps)  # type: ignore[list-item]
+
+        for idx, (timestamp, level, volume) in enumerate(
+            zip(timestamps.tolist(), level_ids.tolist(), volumes.tolist())
+        ):
+            if level == level_count:
+                level_count += 1
+            level_volumes[level] += volume
+            total_volume += volume
+
+            # Level volumes only grow, so the POC can be tracked without rescanning the profile.
+            level_volume = float(level_volumes[level])
+            level_price = level_prices[level]
+            if level_volume > poc_volume or (level_volume == poc_volume and level_price < poc_price):
+                poc_price = level_price
+                poc_volume = level_volume
+
+            poc, vah, val = self._compute_profile(
+                levels[:level_count], level_volumes[:level_count], total_volume, poc_price
             )
+            # Profile values are already clean floats/None, so skip pydantic validation.
+            results[idx] = POCResult.construct(timestamp=timestamp, poc=poc, vah=vah, val=val)
 
         return results
 
+    def _parse_bars(self, bars: List[list]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Return (timestamps, closes, volumes) columns after a single shape check."""
+        data = self._bars_array(bars)
+        timestamps = data[:, 0].astype(np.int64)
+        closes = data[:, 4].astype(float)
+        volumes = data[:, 5].astype(float)
+        return timestamps, closes, volumes
+
     @staticmethod
-    def _parse_bars(bars: List[list]) -> List[Tuple[int, float, float]]:
-        parsed = []
-        for row in bars:
-            if not isinstance(row, (list, tuple)) or len(row) < 7:
-                raise ValueError(
-                    "Each bar must be a list like [timestamp, open, high, low, close, volume, is_close]"
-                )
-            timestamp = int(row[0])
-            close = float(row[4])
-            volume = float(row[5])
-            parsed.append((timestamp, close, volume))
-        return parsed
-
-    def _compute_profile(self, profile: Dict[float, float]) -> Tuple[float | None, float | None, float | None]:
-        if not profile:
-            return None, None, None
+    def _price_levels(closes: np.ndarray, tick_size: float | None) -> Tuple[np.ndarray, np.ndarray]:
+        """Return one price per profile level in order of first appearance and each bar's level id.
 
-        total_volume = sum(profile.values())
-        if total_volume <= 0:
+        Numbering by first appearance keeps the levels seen so far a contiguous prefix. With a
+        tick size, closes are keyed by integer tick count and each level is priced at its tick.
+        """
+        if tick_size is None:
+            keys = closes
+        else:
+            ticks = np.rint(closes / tick_size)
+            # NaN/inf closes or tiny ticks would otherwise wrap around in the int64 cast.
+            if not (np.isfinite(ticks).all() and np.abs(ticks).max() < 2.0**63):
+                raise ValueError("closes must be finite and within int64 tick counts of tick_size")
+            keys = ticks.astype(np.int64)
+        unique_keys, first_index, inverse = np.unique(keys, return_index=True, return_inverse=True)
+        appearance = np.argsort(first_index)
+        rank = np.empty_like(appearance)
+        rank[appearance] = np.arange(appearance.size)
+        levels = unique_keys[appearance]
+        if tick_size is not None:
+            # Round away float noise such as 3 * 0.1 == 0.30000000000000004.
+            decimals = max(0, -Decimal(repr(tick_size)).normalize().as_tuple().exponent)
+            levels = np.round(levels * tick_size, decimals)
+        return levels.astype(float), rank[inverse.ravel()]
+
+    def _compute_profile(
+        self,
+        prices: np.ndarray,
+        volumes: np.ndarray,
+        total_volume: float,
+        poc_price: float,
+    ) -> Tuple[float | None, float | None, float | None]:
+        if prices.size == 0 or total_volume <= 0:
             return None, None, None
 
-        sorted_levels = sorted(profile.items(), key=lambda item: (-item[1], item[0]))
-        poc_price, poc_volume = sorted_levels[0]
-
         target_volume = total_volume * self.params.value_area_pct
-        accum_volume = poc_volume
-        included_prices = {poc_price}
-
-        remaining = sorted_levels[1:]
-        for price, vol in remaining:
-            if accum_volume >= target_volume:
-                break
-            included_prices.add(price)
-            accum_volume += vol
-
-        vah = max(included_prices) if included_prices else None
-        val = min(included_prices) if included_prices else None
+        vah, val = _value_area_bounds(prices, volumes, target_volume)
 
         return (
             ta_indicator_poc._clean(poc_price),
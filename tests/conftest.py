@@ -0,0 +1,31 @@
+"""Shared pytest fixtures built from the bundled BTCUSDT sample."""
+
+from __future__ import annotations
+
+import csv
+import sys
+from pathlib import Path
+from typing import List
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))  # indicator modules live at the repository root
+
+FIXTURE = ROOT / "BTCUSDT-1m-2025-11.csv"
+
+
+def load_bars(limit: int) -> List[list]:
+    """Read the first `limit` rows as [timestamp, open, high, low, close, volume, is_close]."""
+    bars = []
+    with FIXTURE.open(newline="") as handle:
+        reader = csv.reader(handle)
+        next(reader)  # header
+        for row, _ in zip(reader, range(limit)):
+            bars.append([int(row[0]), *(float(value) for value in row[1:6]), True])
+    return bars
+
+
+@pytest.fixture(scope="session")
+def btc_bars() -> List[list]:
+    return load_bars(2000)
@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+import pytest
+from pydantic import ValidationError
+
+from base import IndicatorBase
+from ta_indicator import TAConfig
+from ta_indicator_poc import POCParams
+
+
+def test_cached_model_returns_independent_validated_copies():
+    first = IndicatorBase._cached_model(TAConfig, {"name": "macd", "params": [12, 26, 9]})
+    second = IndicatorBase._cached_model(TAConfig, {"params": (12, 26, 9), "name": "macd"})
+    assert first == second == TAConfig(name="MACD", params=(12, 26, 9))
+    assert first is not second
+
+    poc = IndicatorBase._cached_model(POCParams, {"tick_size": 0.5})
+    assert isinstance(poc, POCParams) and poc.tick_size == 0.5
+
+
+def test_cached_model_keeps_validation_errors():
+    with pytest.raises(ValidationError):
+        IndicatorBase._cached_model(TAConfig, {"name": "unknown"})
+    with pytest.raises(ValidationError):
+        IndicatorBase._cached_model(POCParams, {"value_area_pct": 0})
+    with pytest.raises(ValidationError):
+        IndicatorBase._cached_model(TAConfig, {"name": "ATR", "params": {"period": 14}})  # unhashable input
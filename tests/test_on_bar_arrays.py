@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from ta_indicator import ta_indicator
+from ta_indicator_poc import ta_indicator_poc
+
+INDICATORS = [
+    pytest.param(lambda: ta_indicator({"name": "ATR"}), id="ATR"),
+    pytest.param(lambda: ta_indicator({"name": "CCI"}), id="CCI"),
+    pytest.param(lambda: ta_indicator({"name": "MACD"}), id="MACD"),
+    pytest.param(lambda: ta_indicator({"name": "RSI"}), id="RSI"),
+    pytest.param(lambda: ta_indicator({"name": "MA"}), id="MA"),
+    pytest.param(lambda: ta_indicator({"name": "EMA"}), id="EMA"),
+    pytest.param(lambda: ta_indicator({"name": "EMA", "return_type": "dict"}), id="EMA-dict"),
+    pytest.param(lambda: ta_indicator_poc(), id="POC"),
+    pytest.param(lambda: ta_indicator_poc({"tick_size": 5.0}), id="POC-tick"),
+]
+
+
+def _columns(bars):
+    return [list(column) for column in zip(*bars)][:6]
+
+
+def _rows(results):
+    return [row if isinstance(row, dict) else row.dict() for row in results]
+
+
+@pytest.mark.parametrize("factory", INDICATORS)
+def test_on_bar_arrays_matches_on_bar(btc_bars, factory):
+    bars = btc_bars[:1000]
+    expected = factory().on_bar(bars)
+    results = factory().on_bar_arrays(*_columns(bars))
+    assert [type(row) for row in results] == [type(row) for row in expected]
+    np.testing.assert_equal(_rows(results), _rows(expected))  # NaN warm-ups compare equal
+
+
+@pytest.mark.parametrize("factory", INDICATORS)
+def test_on_bar_arrays_rejects_mismatched_columns(btc_bars, factory):
+    columns = _columns(btc_bars[:50])
+    columns[4] = columns[4][:-1]
+    with pytest.raises(ValueError):
+        factory().on_bar_arrays(*columns)
+
+
+@pytest.mark.parametrize("factory", INDICATORS)
+@pytest.mark.parametrize("field", [0, 4])
+def test_on_bar_arrays_rejects_none_cells(btc_bars, factory, field):
+    bars = [list(bar) for bar in btc_bars[:50]]
+    bars[10][field] = None
+    with pytest.raises(ValueError):
+        factory().on_bar_arrays(*_columns(bars))
+    with pytest.raises(ValueError):
+        factory().on_bar(bars)  # same contract as the row-wise path
+
+
+@pytest.mark.parametrize("factory", INDICATORS)
+def test_on_bar_arrays_empty_columns(factory):
+    assert factory().on_bar_arrays([], [], [], [], [], []) == []
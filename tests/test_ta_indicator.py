@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from ta_indicator import ta_indicator
+
+STREAMING_CASES = [
+    ("ATR", (14,)),
+    ("MACD", (12, 26, 9)),
+    ("RSI", (14,)),
+    ("EMA", (20,)),
+]
+
+
+def _values(results, name):
+    _, fields = ta_indicator._RESULT_TYPES[name]
+    rows = [row if isinstance(row, dict) else row.dict() for row in results]
+    return [row["timestamp"] for row in rows], np.array([[row[f] for f in fields] for row in rows], dtype=float)
+
+
+def _assert_matches_full(results, bars, name, params):
+    """Compare `results` with the trailing rows of a full recompute over `bars`."""
+    expected = ta_indicator({"name": name, "params": params}).on_bar(bars)[-len(results) :]
+    timestamps, values = _values(results, name)
+    expected_timestamps, expected_values = _values(expected, name)
+    assert timestamps == expected_timestamps
+    np.testing.assert_allclose(values, expected_values, rtol=1e-9, atol=1e-9, equal_nan=True)
+
+
+def _stream(indicator, bars, sizes):
+    results = []
+    start = 0
+    for size in sizes:
+        results += indicator.on_new_bars(bars[start : start + size])
+        start += size
+    return results
+
+
+@pytest.mark.parametrize("name,params", STREAMING_CASES)
+@pytest.mark.parametrize("sizes", [[1] * 120, [2, 1, 37, 1, 4, 255, 1, 1, 98], [500]])
+def test_new_bars_match_full_recompute(btc_bars, name, params, sizes):
+    indicator = ta_indicator({"name": name, "params": params})
+    bars = btc_bars[: sum(sizes)]
+    _assert_matches_full(_stream(indicator, bars, sizes), bars, name, params)
+    assert indicator._stream is not None and indicator._warmup is None
+
+
+@pytest.mark.parametrize("name,params", STREAMING_CASES)
+def test_new_bars_replace_forming_last_bar(btc_bars, name, params):
+    indicator = ta_indicator({"name": name, "params": params})
+    indicator.on_new_bars(btc_bars[:300])
+    forming = list(btc_bars[300])
+    for close in (forming[4] + 25.0, forming[4] - 25.0):
+        forming[4] = close
+        forming[2] = max(forming[2], close)
+        forming[3] = min(forming[3], close)
+        _assert_matches_full(indicator.on_new_bars([forming]), btc_bars[:300] + [forming], name, params)
+    _assert_matches_full(indicator.on_new_bars(btc_bars[300:302]), btc_bars[:302], name, params)
+
+
+@pytest.mark.parametrize("name,params", STREAMING_CASES)
+def test_new_bars_replace_forming_bar_during_warm_up(btc_bars, name, params):
+    indicator = ta_indicator({"name": name, "params": params})
+    for idx in range(60):
+        forming = list(btc_bars[idx])
+        forming[4] = forming[2]
+        _assert_matches_full(indicator.on_new_bars([forming]), btc_bars[:idx] + [forming], name, params)
+        _assert_matches_full(indicator.on_new_bars([btc_bars[idx]]), btc_bars[: idx + 1], name, params)
+    assert indicator._stream is not None
+
+
+@pytest.mark.parametrize("name,params", STREAMING_CASES)
+def test_new_bars_reject_out_of_order_input(btc_bars, name, params):
+    indicator = ta_indicator({"name": name, "params": params})
+    indicator.on_new_bars(btc_bars[:100])
+    with pytest.raises(ValueError):
+        indicator.on_new_bars(btc_bars[50:60])
+    with pytest.raises(ValueError):
+        indicator.on_new_bars([btc_bars[101], btc_bars[100]])
+    # Rejected calls leave the state untouched.
+    _assert_matches_full(indicator.on_new_bars(btc_bars[100:110]), btc_bars[:110], name, params)
+
+
+@pytest.mark.parametrize("name", ["MA", "CCI"])
+def test_new_bars_require_a_recurrent_indicator(btc_bars, name):
+    with pytest.raises(ValueError):
+        ta_indicator({"name": name}).on_new_bars(btc_bars[:10])
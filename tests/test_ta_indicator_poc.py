@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+from pydantic import ValidationError
+
+from ta_indicator_poc import _value_area_bounds, ta_indicator_poc
+
+
+def _reference_bounds(prices, volumes, target_volume):
+    """Walk levels by (-volume, price) until the running volume reaches the target."""
+    included = []
+    running = 0.0
+    for volume, price in sorted(zip(-volumes, prices)):
+        included.append(price)
+        running -= volume
+        if running >= target_volume:
+            break
+    return max(included), min(included)
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_value_area_bounds_match_reference_with_tied_volumes(seed):
+    rng = np.random.default_rng(seed)
+    size = int(rng.integers(1, 60))
+    prices = rng.permutation(np.arange(size, dtype=float) * 0.5 + 100.0)
+    # Few distinct volumes so many levels tie, including at the cut-off.
+    volumes = rng.integers(1, 4, size=size).astype(float)
+    for pct in (0.1, 0.5, 0.7, 1.0):
+        target = volumes.sum() * pct
+        assert _value_area_bounds(prices, volumes, target) == _reference_bounds(prices, volumes, target)
+
+
+def test_value_area_ties_take_lowest_price_first():
+    prices = np.array([103.0, 101.0, 102.0, 100.0])
+    volumes = np.array([5.0, 5.0, 5.0, 5.0])
+    assert _value_area_bounds(prices, volumes, 10.0) == (101.0, 100.0)
+
+
+def _bars(closes, volumes):
+    return [[idx, close, close, close, close, volume, True] for idx, (close, volume) in enumerate(zip(closes, volumes))]
+
+
+@pytest.mark.parametrize("closes", [(104.0, 96.0), (96.0, 104.0)])
+def test_tick_buckets_are_reported_at_the_tick_price(closes):
+    results = ta_indicator_poc({"tick_size": 10}).on_bar(_bars(closes, (1.0, 2.0)))
+    assert [row.poc for row in results] == [100.0, 100.0]
+    assert (results[-1].vah, results[-1].val) == (100.0, 100.0)
+
+
+def test_tick_prices_drop_float_noise():
+    results = ta_indicator_poc({"tick_size": 0.1, "value_area_pct": 1.0}).on_bar(
+        _bars((0.29, 0.71, 0.31), (5.0, 1.0, 1.0))
+    )
+    assert (results[-1].poc, results[-1].vah, results[-1].val) == (0.3, 0.7, 0.3)
+
+
+@pytest.mark.parametrize("tick_size", [float("inf"), float("nan"), 0.0, -1.0])
+def test_tick_size_must_be_finite_and_positive(tick_size):
+    with pytest.raises(ValidationError):
+        ta_indicator_poc({"tick_size": tick_size})
+
+
+@pytest.mark.parametrize(
+    "tick_size,closes",
+    [
+        (10.0, (100.0, float("nan"))),
+        (10.0, (100.0, float("inf"))),
+        (1e-16, (109557.2, 109572.4)),
+    ],
+)
+def test_tick_counts_outside_int64_are_rejected(tick_size, closes):
+    with pytest.raises(ValueError):
+        ta_indicator_poc({"tick_size": tick_size}).on_bar(_bars(closes, (1.0, 1.0)))